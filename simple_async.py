@@ -0,0 +1,281 @@
+"""Асинхронный API перебора: события прогресса и находок как async-итератор.
+
+Пространство перебора делится на блоки (длина, [start, end)). Блоки
+выполняются на общем пуле процессов или потоков и работают квантами
+времени: по истечении кванта блок возвращает позицию, с которой его
+нужно продолжить. Поэтому отмена и timeout срабатывают не позже чем
+через один квант, а несколько одновременных подборов делят один пул,
+не блокируя цикл событий.
+"""
+import asyncio
+import os
+import pickle
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import product, islice
+
+
+BLOCK_SIZE = 1 << 18     # кандидатов в одном блоке
+TIME_SLICE = 0.1         # секунд работы блока до возврата управления
+TAIL_LEN = 3             # хвост пароля перебирается через itertools.product
+BATCH_CHUNK = 1024       # кандидатов в одном вызове пакетной проверки
+
+_EXECUTORS = {}
+
+# Пулы родителя не работают в дочернем процессе после fork
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_EXECUTORS.clear)
+
+
+def get_executor(backend: str = "process", max_workers: int = None):
+    """Общий пул для всех подборов с данным backend и размером."""
+    max_workers = max_workers or os.cpu_count() or 1
+    key = (backend, max_workers)
+    if key not in _EXECUTORS:
+        if backend == "process":
+            _EXECUTORS[key] = ProcessPoolExecutor(max_workers=max_workers)
+        elif backend == "thread":
+            _EXECUTORS[key] = ThreadPoolExecutor(max_workers=max_workers)
+        else:
+            raise ValueError(f"Неизвестный backend: {backend}")
+    return _EXECUTORS[key]
+
+
+def _index_to_word(charset: str, index: int, length: int) -> str:
+    """Кандидат с номером index среди слов длины length (порядок как у product)."""
+    base = len(charset)
+    chars = []
+    for _ in range(length):
+        index, r = divmod(index, base)
+        chars.append(charset[r])
+    return "".join(reversed(chars))
+
+
+def _block_words(charset: str, length: int, start: int, end: int):
+    """Кандидаты длины length с номерами [start, end) в порядке product."""
+    tail_len = min(length, TAIL_LEN)
+    tail_size = len(charset) ** tail_len
+    head_index, offset = divmod(start, tail_size)
+    pos = start
+
+    while pos < end:
+        head = _index_to_word(charset, head_index, length - tail_len)
+        stop = min(end, (head_index + 1) * tail_size)
+        for combo in islice(product(charset, repeat=tail_len), offset, offset + stop - pos):
+            yield head + "".join(combo)
+        pos = stop
+        head_index += 1
+        offset = 0
+
+
+def _crack_block(verifier, batch, targets, charset: str, length: int,
+                 start: int, end: int, time_slice: float):
+    """Проверить кандидатов длины length с номерами [start, end).
+
+    Со скалярной проверкой targets -- кортеж хэшей, verifier вызывается для
+    каждого. С пакетной batch(passwords, targets) targets -- контейнер сырых
+    дайджестов (TargetIndex), кандидаты проверяются пачками по BATCH_CHUNK.
+
+    Возвращает (hits, next_index), next_index -- откуда продолжать. Работа
+    прерывается по истечении кванта времени; скалярная проверка -- ещё и на
+    первой находке, а пакетная копит находки за весь квант: в больших списках
+    они частые, и возврат на каждую стоил бы лишнего обмена с пулом.
+    """
+    slice_end = time.perf_counter() + time_slice
+    words = _block_words(charset, length, start, end)
+    pos = start
+    hits = []
+
+    if batch is None:
+        for password in words:
+            pos += 1
+            for target_hash in targets:
+                if verifier(password, target_hash):
+                    hits.append((password, target_hash))
+            if hits or time.perf_counter() > slice_end:
+                break
+        return hits, pos
+
+    while True:
+        chunk = list(islice(words, BATCH_CHUNK))
+        if not chunk:
+            break
+        pos += len(chunk)
+        hits.extend(batch(chunk, targets))
+        if time.perf_counter() > slice_end:
+            break
+    return hits, pos
+
+
+def _blocks(charset: str, min_len: int, max_len: int, block_size: int):
+    """Блоки (length, start, end) в порядке перебора."""
+    for length in range(min_len, max_len + 1):
+        total = len(charset) ** length
+        for start in range(0, total, block_size):
+            yield length, start, min(start + block_size, total)
+
+
+async def crack(
+    targets,
+    verifier,
+    charset: str = "abcdefghijklmnopqrstuvwxyz",
+    min_len: int = 1,
+    max_len: int = 8,
+    workers: int = 1,
+    timeout: float = None,
+    backend: str = "process",
+    executor=None,
+    progress_interval: float = 0.5,
+    block_size: int = BLOCK_SIZE,
+    time_slice: float = TIME_SLICE,
+    batch=None,
+):
+    """Асинхронный перебор. Выдаёт события-словари с ключом "event":
+
+    start -- {"targets", "keyspace"}
+    progress -- {"attempts", "time", "speed"}, не чаще progress_interval
+    hit -- {"password", "hash", "attempts", "time"}
+    done -- {"found", "cracked", "attempts", "time", "timeout"}
+
+    targets -- один хэш или список хэшей; перебор идёт, пока не найдены все.
+    Каждый кандидат проверяется verifier против каждого хэша, а список
+    передаётся с каждым блоком -- это для нескольких солёных хэшей (bcrypt,
+    Argon2). Для больших списков несолёных хэшей передайте batch из
+    simple_hashing.get_batch_verifier() и targets -- TargetIndex: индекс
+    сериализуется как путь к файлу, и рабочие процессы отображают одни и те
+    же страницы; verifier тогда не используется.
+    workers -- сколько блоков этого подбора выполняется одновременно.
+    executor -- общий пул; по умолчанию get_executor(backend). Для backend
+    "process" verifier должен сериализоваться (функция модуля или partial).
+
+    Отмена задачи, которая итерирует crack(), отменяет ещё не начатые блоки;
+    уже запущенные завершаются в пределах time_slice.
+    """
+    loop = asyncio.get_running_loop()
+    if executor is None:
+        executor = get_executor(backend, max(workers, os.cpu_count() or 1))
+    if isinstance(executor, ProcessPoolExecutor):
+        try:
+            pickle.dumps((verifier, batch))
+        except Exception as e:
+            raise ValueError(
+                "Для backend \"process\" функция проверки должна сериализоваться "
+                "(функция модуля или functools.partial, не lambda/замыкание); "
+                f"используйте backend=\"thread\" или workers=1: {e}"
+            ) from e
+    if batch is None:
+        if isinstance(targets, str):
+            targets = [targets]
+        targets = tuple(dict.fromkeys(targets))
+    total = len(targets)
+    found = set()
+
+    blocks = _blocks(charset, min_len, max_len, block_size)
+    retry = deque()
+    inflight = {}
+    attempts = 0
+    timed_out = False
+
+    start_time = time.perf_counter()
+    last_progress = start_time
+    yield {
+        "event": "start",
+        "targets": total,
+        "keyspace": sum(len(charset) ** n for n in range(min_len, max_len + 1)),
+    }
+
+    try:
+        while len(found) < total:
+            # Держим в работе не больше workers блоков этого подбора
+            while len(inflight) < workers:
+                block = retry.popleft() if retry else next(blocks, None)
+                if block is None:
+                    break
+                length, start, end = block
+                pending = targets
+                if batch is None:
+                    pending = tuple(t for t in targets if t not in found)
+                future = loop.run_in_executor(
+                    executor, _crack_block,
+                    verifier, batch, pending, charset, length, start, end, time_slice,
+                )
+                inflight[future] = block
+
+            if not inflight:
+                break
+
+            wait_for = progress_interval
+            if timeout:
+                wait_for = min(wait_for, max(0.0, start_time + timeout - time.perf_counter()))
+            done, _ = await asyncio.wait(
+                inflight, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            for future in done:
+                length, start, end = inflight.pop(future)
+                hits, next_index = future.result()
+                attempts += next_index - start
+                if next_index < end:
+                    retry.appendleft((length, next_index, end))
+
+                hit_time = time.perf_counter() - start_time
+                for password, target_hash in hits:
+                    if target_hash not in found:
+                        found.add(target_hash)
+                        yield {
+                            "event": "hit",
+                            "password": password,
+                            "hash": target_hash,
+                            "attempts": attempts,
+                            "time": hit_time,
+                        }
+
+            now = time.perf_counter()
+            if timeout and now - start_time > timeout:
+                timed_out = True
+                break
+            if now - last_progress >= progress_interval:
+                last_progress = now
+                elapsed = now - start_time
+                yield {
+                    "event": "progress",
+                    "attempts": attempts,
+                    "time": elapsed,
+                    "speed": attempts / elapsed if elapsed > 0 else 0,
+                }
+
+        yield {
+            "event": "done",
+            "found": bool(found),
+            "cracked": len(found),
+            "attempts": attempts,
+            "time": time.perf_counter() - start_time,
+            "timeout": timed_out,
+        }
+    finally:
+        for future in inflight:
+            future.cancel()
+
+
+async def crack_result(targets, verifier, on_event=None, **kwargs) -> dict:
+    """Выполнить crack() и вернуть итоговый словарь, как bruteforce().
+
+    В словаре password -- первая находка, hits -- все находки
+    [{"password", "hash"}]. on_event -- необязательная функция,
+    получающая каждое событие.
+    """
+    result = {"found": False, "hits": [], "attempts": 0, "time": 0.0}
+    async for event in crack(targets, verifier, **kwargs):
+        if on_event:
+            on_event(event)
+        if event["event"] == "hit":
+            result.setdefault("password", event["password"])
+            result["hits"].append({"password": event["password"], "hash": event["hash"]})
+        elif event["event"] == "done":
+            result["found"] = event["found"]
+            result["attempts"] = event["attempts"]
+            result["time"] = event["time"]
+            if event["timeout"]:
+                result["timeout"] = True
+    return result
@@ -0,0 +1,145 @@
+"""Буферизованный журнал событий в формате JSON Lines.
+
+События (старт задачи, прогресс, находки, итоги) копятся в памяти и
+записываются в один открытый файл пачками: при заполнении буфера и по
+таймеру. Когда файл превышает max_bytes, он ротируется в events.jsonl.1,
+events.jsonl.2 и т.д. Сводки CSV/JSON строятся из этого потока через
+read_events().
+"""
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+
+
+EVENTS_FILE = os.path.join("out", "events.jsonl")
+
+
+class EventSink:
+    """Буферизованная запись событий с ротацией по размеру и сбросом по таймеру."""
+
+    def __init__(self, path: str = EVENTS_FILE, max_bytes: int = 10 * 1024 * 1024,
+                 backups: int = 5, flush_interval: float = 1.0,
+                 buffer_bytes: int = 64 * 1024, run_id: str = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.buffer_bytes = buffer_bytes
+        self.run_id = run_id or uuid.uuid4().hex
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self._buffer = []
+        self._buffered = 0
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+        self._flusher = threading.Thread(
+            target=self._flush_loop, args=(flush_interval,), daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def emit(self, event: str, **fields) -> dict:
+        """Добавить событие в буфер и вернуть записанный словарь."""
+        record = {"ts": round(time.time(), 6), "run": self.run_id, "event": event}
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+
+        with self._lock:
+            self._buffer.append(line)
+            self._buffered += len(line)
+            if self._buffered >= self.buffer_bytes:
+                self._write()
+        return record
+
+    def flush(self):
+        """Записать буфер в файл."""
+        with self._lock:
+            self._write()
+
+    def close(self):
+        """Остановить таймер, записать остаток и закрыть файл."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._flusher is not threading.current_thread():
+            self._flusher.join()
+        with self._lock:
+            self._write()
+            self._file.close()
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _flush_loop(self, interval: float):
+        while not self._closed.wait(interval):
+            self.flush()
+
+    def _write(self):
+        """Записать буфер (вызывается под self._lock)."""
+        if not self._buffer or self._file.closed:
+            return
+        self._file.write("".join(self._buffer))
+        self._file.flush()
+        self._buffer.clear()
+        self._buffered = 0
+
+        if self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self):
+        self._file.close()
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+
+def read_events(path: str = EVENTS_FILE, run_id: str = None, event: str = None,
+                job: str = None):
+    """Прочитать события из файла и его ротаций (от старых к новым).
+
+    run_id, event и job -- необязательные фильтры.
+    """
+    rotated = []
+    i = 1
+    while os.path.exists(f"{path}.{i}"):
+        rotated.append(f"{path}.{i}")
+        i += 1
+
+    for file_path in list(reversed(rotated)) + [path]:
+        if not os.path.exists(file_path):
+            continue
+        with open(file_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # недописанная строка
+                if run_id is not None and record.get("run") != run_id:
+                    continue
+                if event is not None and record.get("event") != event:
+                    continue
+                if job is not None and record.get("job") != job:
+                    continue
+                yield record
+
+
+def results_from_events(events) -> list:
+    """Строки результатов из событий "result" (без служебных полей)."""
+    rows = []
+    for record in events:
+        if record.get("event") == "result":
+            rows.append({k: v for k, v in record.items() if k not in ("ts", "run", "job", "event")})
+    return rows
@@ -1,7 +1,164 @@
-"""Простые функции для проверки паролей против хэшей."""
+"""Простые функции для проверки паролей против хэшей.
+
+Алгоритмы регистрируются в реестре через register_algorithm(). Тяжёлые
+библиотеки (bcrypt, argon2) импортируются только при первой проверке,
+поэтому рабочие процессы для MD5/SHA не тратят время на их загрузку.
+"""
 import hashlib
-import bcrypt
-from argon2 import PasswordHasher
+import struct
+from functools import partial
+
+
+# Реестр алгоритмов: имя -> {"verify", "batch", "cost", "check"}
+_ALGORITHMS = {}
+_ALIASES = {}
+
+
+def register_algorithm(name: str, verifier, batch=None, cost: float = 1, aliases=(),
+                       check=None):
+    """Зарегистрировать алгоритм.
+
+    verifier -- функция (password, target_hash) -> bool.
+    batch -- необязательная функция (passwords, targets) -> [(password, hex)],
+             где targets -- контейнер сырых дайджестов (bytes), поддерживающий `in`.
+    cost -- примерная стоимость одной проверки относительно MD5.
+    aliases -- дополнительные имена алгоритма.
+    check -- необязательная функция (target_hash) -> None, бросающая ValueError
+             для хэша, который алгоритм не может разобрать. Нужна там, где
+             verifier на таком хэше молча возвращает False.
+    """
+    name = name.lower().strip()
+    _ALGORITHMS[name] = {"verify": verifier, "batch": batch, "cost": cost, "check": check}
+    _ALIASES[name] = name
+    for alias in aliases:
+        _ALIASES[alias.lower().strip()] = name
+
+
+def unregister_algorithm(algo: str):
+    """Удалить алгоритм и все его псевдонимы из реестра."""
+    name = resolve_algorithm(algo)
+    del _ALGORITHMS[name]
+    for alias in [alias for alias, target in _ALIASES.items() if target == name]:
+        del _ALIASES[alias]
+
+
+def _lookup(algo: str):
+    """Найти запись реестра по имени или псевдониму."""
+    name = _ALIASES.get(algo.lower().strip())
+    if name is None:
+        raise ValueError(f"Неизвестный алгоритм: {algo}")
+    return _ALGORITHMS[name]
+
+
+def resolve_algorithm(algo: str) -> str:
+    """Каноническое имя алгоритма по имени или псевдониму."""
+    _lookup(algo)
+    return _ALIASES[algo.lower().strip()]
+
+
+def list_algorithms():
+    """Список зарегистрированных алгоритмов."""
+    return list(_ALGORITHMS)
+
+
+def get_verifier(algo: str):
+    """Получить функцию проверки для алгоритма."""
+    return _lookup(algo)["verify"]
+
+
+def get_batch_verifier(algo: str):
+    """Получить пакетную функцию проверки (или None, если её нет)."""
+    return _lookup(algo)["batch"]
+
+
+def get_cost(algo: str) -> float:
+    """Получить относительную стоимость проверки одного пароля."""
+    return _lookup(algo)["cost"]
+
+
+def check_hash(algo: str, target_hash: str):
+    """Бросить ValueError, если алгоритм не может разобрать хэш."""
+    check = _lookup(algo)["check"]
+    if check is not None:
+        check(target_hash)
+
+
+def _md4(data: bytes) -> bytes:
+    """MD4 на чистом Python (OpenSSL 3 по умолчанию не даёт md4)."""
+    def rotl(x, n):
+        x &= 0xFFFFFFFF
+        return ((x << n) | (x >> (32 - n))) & 0xFFFFFFFF
+
+    length = len(data) * 8
+    data += b"\x80" + b"\x00" * ((55 - len(data)) % 64) + struct.pack("<Q", length)
+    a, b, c, d = 0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476
+
+    for offset in range(0, len(data), 64):
+        x = struct.unpack("<16I", data[offset:offset + 64])
+        aa, bb, cc, dd = a, b, c, d
+
+        for k in range(16):
+            f = (b & c) | (~b & d)
+            a, b, c, d = d, rotl(a + f + x[k], (3, 7, 11, 19)[k % 4]), b, c
+        for k in range(16):
+            g = (b & c) | (b & d) | (c & d)
+            i = (k % 4) * 4 + k // 4
+            a, b, c, d = d, rotl(a + g + x[i] + 0x5A827999, (3, 5, 9, 13)[k % 4]), b, c
+        for k in range(16):
+            h = b ^ c ^ d
+            i = (0, 8, 4, 12, 2, 10, 6, 14, 1, 9, 5, 13, 3, 11, 7, 15)[k]
+            a, b, c, d = d, rotl(a + h + x[i] + 0x6ED9EBA1, (3, 9, 11, 15)[k % 4]), b, c
+
+        a = (a + aa) & 0xFFFFFFFF
+        b = (b + bb) & 0xFFFFFFFF
+        c = (c + cc) & 0xFFFFFFFF
+        d = (d + dd) & 0xFFFFFFFF
+
+    return struct.pack("<4I", a, b, c, d)
+
+
+def _has_native_md4() -> bool:
+    try:
+        hashlib.new("md4")
+        return True
+    except ValueError:
+        return False
+
+
+_NATIVE_MD4 = _has_native_md4()
+
+
+def digest_password(name: str, password: str) -> bytes:
+    """Сырой дайджест пароля для алгоритма из hashlib (или NTLM)."""
+    if name == "ntlm":
+        data = password.encode("utf-16-le")
+        if _NATIVE_MD4:
+            return hashlib.new("md4", data).digest()
+        return _md4(data)
+    return getattr(hashlib, name)(password.encode()).digest()
+
+
+def verify_digest(name: str, password: str, target_hash: str) -> bool:
+    """Проверить хэш алгоритма из hashlib (или NTLM)."""
+    return digest_password(name, password).hex() == target_hash.lower()
+
+
+def batch_digest(name: str, passwords, targets) -> list:
+    """Пакетная проверка: вернуть [(password, hex)] для найденных дайджестов."""
+    hits = []
+    if name == "ntlm":
+        for password in passwords:
+            digest = digest_password(name, password)
+            if digest in targets:
+                hits.append((password, digest.hex()))
+        return hits
+
+    new = getattr(hashlib, name)
+    for password in passwords:
+        digest = new(password.encode()).digest()
+        if digest in targets:
+            hits.append((password, digest.hex()))
+    return hits
 
 
 def verify_sha1(password: str, target_hash: str) -> bool:
@@ -18,32 +175,59 @@ def verify_md5(password: str, target_hash: str) -> bool:
 
 def verify_bcrypt(password: str, target_hash: str) -> bool:
     """Проверить bcrypt хэш."""
+    import bcrypt
+
     try:
         return bcrypt.checkpw(password.encode(), target_hash.encode())
     except Exception:
         return False
 
 
+def check_bcrypt(target_hash: str):
+    """Проверить, что bcrypt хэш разбирается (соль и параметр стоимости)."""
+    import bcrypt
+
+    try:
+        bcrypt.checkpw(b"", target_hash.encode())
+    except ValueError as e:
+        raise ValueError(f"Некорректный bcrypt хэш {target_hash!r}: {e}") from e
+
+
+_argon2_hasher = None
+
+
 def verify_argon2(password: str, target_hash: str) -> bool:
     """Проверить Argon2 хэш."""
+    global _argon2_hasher
+    if _argon2_hasher is None:
+        from argon2 import PasswordHasher
+        _argon2_hasher = PasswordHasher()
+
     try:
-        hasher = PasswordHasher()
-        hasher.verify(target_hash, password)
+        _argon2_hasher.verify(target_hash, password)
         return True
     except Exception:
         return False
 
 
-def get_verifier(algo: str):
-    """Получить функцию проверки для алгоритма."""
-    algo = algo.lower().strip()
-    if algo == "sha1" or algo == "sha-1":
-        return verify_sha1
-    elif algo == "md5":
-        return verify_md5
-    elif algo == "bcrypt":
-        return verify_bcrypt
-    elif algo == "argon2" or algo == "argon2id":
-        return verify_argon2
-    else:
-        raise ValueError(f"Неизвестный алгоритм: {algo}")
+def check_argon2(target_hash: str):
+    """Проверить, что Argon2 хэш разбирается."""
+    from argon2 import extract_parameters
+
+    try:
+        extract_parameters(target_hash)
+    except ValueError as e:
+        raise ValueError(f"Некорректный Argon2 хэш {target_hash!r}") from e
+
+
+register_algorithm("sha1", verify_sha1, partial(batch_digest, "sha1"), cost=1, aliases=("sha-1",))
+register_algorithm("md5", verify_md5, partial(batch_digest, "md5"), cost=1)
+register_algorithm("sha256", partial(verify_digest, "sha256"), partial(batch_digest, "sha256"),
+                   cost=1.2, aliases=("sha-256",))
+register_algorithm("sha512", partial(verify_digest, "sha512"), partial(batch_digest, "sha512"),
+                   cost=1.5, aliases=("sha-512",))
+register_algorithm("ntlm", partial(verify_digest, "ntlm"), partial(batch_digest, "ntlm"),
+                   cost=1.5 if _NATIVE_MD4 else 20)
+register_algorithm("bcrypt", verify_bcrypt, cost=50000, check=check_bcrypt)
+register_algorithm("argon2", verify_argon2, cost=100000, aliases=("argon2id",),
+                   check=check_argon2)
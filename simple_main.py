@@ -1,8 +1,14 @@
 """Простая программа для подбора пароля."""
 import sys
 import time
-from simple_hashing import get_verifier
-from simple_bruteforce import bruteforce
+from simple_hashing import (
+    get_verifier, get_batch_verifier, list_algorithms, resolve_algorithm, digest_password
+)
+from simple_bruteforce import bruteforce, bruteforce_targets
+from simple_events import EventSink
+from simple_targets import TargetIndex
+from simple_runner import run_and_save
+from simple_planner import get_rate, plan, recommend_max_len, format_duration
 
 
 # Наборы символов
@@ -47,38 +53,42 @@ def main():
     if len(sys.argv) < 2:
         print("Использование:")
         print("  python simple_main.py <algo> [<hash>] [--workers N] [--timeout S]")
-        print("\nАлгоритмы: sha1, md5, bcrypt, argon2")
+        print("  python simple_main.py test [<algo>] [--workers N] [--timeout S]")
+        print("  python simple_main.py plan <algo> [<hash>] [--workers N] [--budget S] [--remeasure]")
+        print(f"\nАлгоритмы: {', '.join(list_algorithms())}")
         print("\nПримеры:")
         print("  python simple_main.py test sha1")
         print("  python simple_main.py sha1 7c4a8d09ca3762af61e59520943dc26494f8941b")
         print("  python simple_main.py md5 e10adc3949ba59abbe56e057f20f883e --workers 8")
         print("  python simple_main.py md5 HASH --workers 8 --timeout 60")
+        print("  python simple_main.py md5 --targets hashes.txt --workers 8 --max-len 6")
+        print("  python simple_main.py plan bcrypt --charset alnum --max-len 10 --workers 8 --budget 3600")
         return
 
     cmd = sys.argv[1].lower()
 
     # Тестовый режим
     if cmd == "test":
-        if len(sys.argv) > 2:
+        workers, timeout = _parse_test_options(sys.argv[2:])
+        if len(sys.argv) > 2 and not sys.argv[2].startswith("--"):
             algo = sys.argv[2].lower()
-            test_cases = TEST_CASES.get(algo, [])
+            if algo not in TEST_CASES:
+                print(f"Неизвестный алгоритм: {algo}")
+                return
+            algos = [algo]
         else:
             # Тестируем всё
-            for algo in TEST_CASES:
-                test_cases = TEST_CASES[algo]
-                print(f"\n{'=' * 60}")
-                print(f"Тестирование {algo.upper()}")
-                print('=' * 60)
-                _run_tests(algo, test_cases)
-            return
+            algos = list(TEST_CASES)
 
-        if not test_cases:
-            print(f"Неизвестный алгоритм: {algo}")
-            return
+        _run_tests(algos, workers, timeout)
+        return
 
-        print(f"\nТестирование {algo.upper()}")
-        print('=' * 60)
-        _run_tests(algo, test_cases)
+    # Оценка времени подбора
+    if cmd == "plan":
+        if len(sys.argv) < 3:
+            print("Укажите алгоритм")
+            return
+        _plan(sys.argv[2].lower(), sys.argv[3:])
         return
 
     #直接крек
@@ -92,12 +102,15 @@ def main():
     # Парсим опции
     workers = 1
     timeout = None
+    targets_file = None
     charset_name = "alnum"
     min_len = 1
     max_len = 8
 
-    for i in range(3, len(sys.argv)):
-        if sys.argv[i] == "--workers" and i + 1 < len(sys.argv):
+    for i in range(2, len(sys.argv)):
+        if sys.argv[i] == "--targets" and i + 1 < len(sys.argv):
+            targets_file = sys.argv[i + 1]
+        elif sys.argv[i] == "--workers" and i + 1 < len(sys.argv):
             workers = int(sys.argv[i + 1])
         elif sys.argv[i] == "--timeout" and i + 1 < len(sys.argv):
             timeout = float(sys.argv[i + 1])
@@ -110,43 +123,112 @@ def main():
 
     charset = CHARSETS.get(charset_name, CHARSETS["alnum"])
 
+    if targets_file:
+        _crack_targets(algo, targets_file, charset, min_len, max_len, workers, timeout)
+        return
+
     _crack_hash(algo, target_hash, charset, min_len, max_len, workers, timeout)
 
 
-def _run_tests(algo: str, test_cases: list):
-    """Запустить тесты для алгоритма."""
+def _parse_test_options(args: list):
+    """Разобрать --workers и --timeout для тестового режима."""
+    workers = None
+    timeout = 60
+    for i in range(len(args)):
+        if args[i] == "--workers" and i + 1 < len(args):
+            workers = int(args[i + 1])
+        elif args[i] == "--timeout" and i + 1 < len(args):
+            timeout = float(args[i + 1])
+    return workers, timeout
+
+
+def _run_tests(algos: list, workers: int = None, timeout: float = 60):
+    """Запустить тесты для алгоритмов одновременно на общем пуле."""
+    cases = []
+    for algo in algos:
+        for label, target_hash, charset_name, min_len, max_len in TEST_CASES[algo]:
+            cases.append((algo, label, target_hash, CHARSETS[charset_name], min_len, max_len))
+
+    print(f"\nТестирование: {', '.join(a.upper() for a in algos)}")
+    print(f"Случаев: {len(cases)}, Workers: {workers or 'auto'}, Timeout: {timeout}s на случай")
+    print('=' * 60)
+
+    def report(row):
+        print(f"\n{row['test'].upper()}:")
+        if row["status"] == "PASSED":
+            print(f"  ✓ НАЙДЕН: '{row['password']}'")
+            print(f"    Попыток: {row['attempts']:,}")
+            print(f"    Время: {row['time_sec']:.2f}s")
+        elif "error" in row:
+            print(f"  ✗ Ошибка: {row['error']}")
+        else:
+            print(f"  ✗ НЕ НАЙДЕН за {row['time_sec']:.2f}s")
+            print(f"    Попыток: {row['attempts']:,}")
+
+    rows, wall_time = run_and_save(cases, workers=workers, timeout=timeout, on_result=report)
+
+    print(f"\n{'=' * 60}")
+    for row in rows[len(cases):]:
+        print(f"{row['test']}: {row['details']}, {row['speed_per_sec']:,} attempts/sec")
+    print(f"Общее время: {wall_time:.2f}s")
+    print("Результаты: out/results.json, out/results.csv")
+
+
+def _plan(algo: str, args: list):
+    """Оценить пространство перебора и время подбора до запуска."""
+    sample_hash = None
+    if args and not args[0].startswith("--"):
+        sample_hash = args[0]
+    elif TEST_CASES.get(algo):
+        sample_hash = TEST_CASES[algo][0][1]
+
+    workers = 1
+    budget = None
+    remeasure = False
+    charset_name = "alnum"
+    min_len = 1
+    max_len = 8
+
+    for i in range(len(args)):
+        if args[i] == "--workers" and i + 1 < len(args):
+            workers = int(args[i + 1])
+        elif args[i] == "--budget" and i + 1 < len(args):
+            budget = float(args[i + 1])
+        elif args[i] == "--remeasure":
+            remeasure = True
+        elif args[i] == "--charset" and i + 1 < len(args):
+            charset_name = args[i + 1]
+        elif args[i] == "--min-len" and i + 1 < len(args):
+            min_len = int(args[i + 1])
+        elif args[i] == "--max-len" and i + 1 < len(args):
+            max_len = int(args[i + 1])
+
+    charset = CHARSETS.get(charset_name, CHARSETS["alnum"])
+
     try:
-        verifier = get_verifier(algo)
+        rate, cached = get_rate(algo, sample_hash, remeasure=remeasure)
     except ValueError as e:
         print(f"Ошибка: {e}")
         return
 
-    for label, target_hash, charset_name, min_len, max_len in test_cases:
-        charset = CHARSETS[charset_name]
-        print(f"\n{label.upper()}:")
-        print(f"  Hash: {target_hash[:40]}...")
-        print(f"  Charset: {charset_name}, Length: {min_len}-{max_len}")
-        print("  Cracking...", end="", flush=True)
+    print(f"\nПлан подбора {algo.upper()}")
+    print(f"Charset: {len(charset)} символов, Length: {min_len}-{max_len}, Workers: {workers}")
+    print(f"Speed: {rate:,.1f} attempts/sec на процесс ({'кэш' if cached else 'измерено'}), "
+          f"{rate * workers:,.1f} attempts/sec всего")
+    print("-" * 72)
+    print(f"{'Len':>4} {'Candidates':>22} {'Cumulative':>22} {'Expected':>10} {'Worst':>10}")
 
-        start = time.perf_counter()
-        result = bruteforce(
-            target_hash,
-            verifier,
-            charset=charset,
-            min_len=min_len,
-            max_len=max_len,
-            workers=1,
-            timeout=60,
-        )
-        elapsed = time.perf_counter() - start
+    for row in plan(len(charset), min_len, max_len, rate, workers):
+        print(f"{row['length']:>4} {row['candidates']:>22,} {row['cumulative']:>22,} "
+              f"{format_duration(row['expected_sec']):>10} {format_duration(row['worst_sec']):>10}")
 
-        if result["found"]:
-            print(f"\n  ✓ НАЙДЕН: '{result['password']}'")
-            print(f"    Попыток: {result['attempts']:,}")
-            print(f"    Время: {result['time']:.2f}s")
+    if budget is not None:
+        best = recommend_max_len(len(charset), min_len, rate, workers, budget)
+        print("-" * 72)
+        if best is None:
+            print(f"Даже длина {min_len} не укладывается в {format_duration(budget)}")
         else:
-            print(f"\n  ✗ НЕ НАЙДЕН за {elapsed:.2f}s")
-            print(f"    Попыток: {result['attempts']:,}")
+            print(f"Рекомендуемый --max-len для бюджета {format_duration(budget)}: {best}")
 
 
 def _crack_hash(algo: str, target_hash: str, charset: str, min_len: int, max_len: int, workers: int, timeout: float):
@@ -166,15 +248,28 @@ def _crack_hash(algo: str, target_hash: str, charset: str, min_len: int, max_len
     print("Searching...", end="", flush=True)
     start = time.perf_counter()
 
-    result = bruteforce(
-        target_hash,
-        verifier,
-        charset=charset,
-        min_len=min_len,
-        max_len=max_len,
-        workers=workers,
-        timeout=timeout,
-    )
+    with EventSink() as sink:
+        sink.emit("job_start", algo=algo, hash=target_hash, charset=len(charset),
+                  min_len=min_len, max_len=max_len, workers=workers, timeout=timeout)
+
+        def report(event):
+            if event["event"] == "start":
+                return
+            sink.emit(event["event"], **{k: v for k, v in event.items() if k != "event"})
+            if event["event"] == "progress":
+                print(f"\rSearching... {event['attempts']:,} attempts, "
+                      f"{event['speed']:,.0f} attempts/sec", end="", flush=True)
+
+        result = bruteforce(
+            target_hash,
+            verifier,
+            charset=charset,
+            min_len=min_len,
+            max_len=max_len,
+            workers=workers,
+            timeout=timeout,
+            on_event=report,
+        )
 
     elapsed = time.perf_counter() - start
 
@@ -192,5 +287,71 @@ def _crack_hash(algo: str, target_hash: str, charset: str, min_len: int, max_len
         print(f"  Speed: {attempts_per_sec:,.0f} attempts/sec")
 
 
+def _crack_targets(algo: str, targets_file: str, charset: str, min_len: int, max_len: int, workers: int, timeout: float):
+    """Крек списка хэшей из файла через общий индекс дайджестов."""
+    try:
+        batch = get_batch_verifier(algo)
+    except ValueError as e:
+        print(f"Ошибка: {e}")
+        return
+    if batch is None:
+        print(f"Ошибка: {algo} не поддерживает пакетную проверку списка хэшей")
+        return
+
+    print(f"\nПодбор {algo.upper()} по списку {targets_file}...")
+    start = time.perf_counter()
+    try:
+        targets = TargetIndex.from_hex_file(targets_file)
+    except (OSError, ValueError) as e:
+        print(f"Ошибка: {e}")
+        return
+    digest_size = len(digest_password(resolve_algorithm(algo), ""))
+    if targets.width != digest_size:
+        print(f"Ошибка: в {targets_file} дайджесты по {targets.width} байт, "
+              f"а {algo} даёт {digest_size} байт")
+        targets.close()
+        return
+    print(f"Targets: {len(targets):,} (индекс {targets.path}, {time.perf_counter() - start:.2f}s)")
+    print(f"Charset: {len(charset)} символов, Length: {min_len}-{max_len}")
+    print(f"Workers: {workers}, Timeout: {timeout or 'none'}s")
+    print("-" * 60)
+
+    with EventSink() as sink:
+        sink.emit("job_start", algo=algo, targets_file=targets_file, targets=len(targets),
+                  charset=len(charset), min_len=min_len, max_len=max_len,
+                  workers=workers, timeout=timeout)
+
+        # Находки и прогресс пишутся по мере появления: прерванный долгий
+        # прогон оставляет в журнале всё, что успел найти
+        def report(event):
+            if event["event"] == "start":
+                return
+            sink.emit(event["event"], **{k: v for k, v in event.items() if k != "event"})
+            if event["event"] == "hit":
+                line = f"Found: {event['hash']} -> '{event['password']}'"
+                print("\r" + line.ljust(60), flush=True)
+            elif event["event"] == "progress":
+                print(f"\rSearching... {event['attempts']:,} attempts, "
+                      f"{event['speed']:,.0f} attempts/sec", end="", flush=True)
+
+        result = bruteforce_targets(
+            targets,
+            batch,
+            charset=charset,
+            min_len=min_len,
+            max_len=max_len,
+            workers=workers,
+            timeout=timeout,
+            on_event=report,
+        )
+
+    print()
+    print(f"Cracked: {len(result['hits']):,}/{len(targets):,}")
+    print(f"  Attempts: {result['attempts']:,}")
+    print(f"  Time: {result['time']:.2f}s")
+    attempts_per_sec = result['attempts'] / result['time'] if result['time'] > 0 else 0
+    print(f"  Speed: {attempts_per_sec:,.0f} attempts/sec")
+
+
 if __name__ == "__main__":
     main()
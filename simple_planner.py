@@ -0,0 +1,143 @@
+"""Оценка пространства перебора и времени подбора до запуска."""
+import json
+import os
+import socket
+import time
+
+from simple_hashing import get_verifier, check_hash, resolve_algorithm
+from simple_bruteforce import generate_passwords
+
+
+RATES_FILE = os.path.join("out", "rates.json")
+
+
+def keyspace_for_length(charset_size: int, length: int) -> int:
+    """Число кандидатов ровно заданной длины."""
+    return charset_size ** length
+
+
+def keyspace(charset_size: int, min_len: int, max_len: int) -> int:
+    """Точное число кандидатов для диапазона длин."""
+    return sum(keyspace_for_length(charset_size, n) for n in range(min_len, max_len + 1))
+
+
+def _cost_params(sample_hash: str) -> str:
+    """Параметры стоимости из хэша ($2a$10, $argon2id$v=19$m=...), влияющие на скорость."""
+    if not sample_hash or not sample_hash.startswith("$"):
+        return ""
+    if sample_hash.startswith("$2"):
+        return sample_hash[:6]
+    return sample_hash.rsplit("$", 2)[0]
+
+
+def measure_rate(algo: str, sample_hash: str, duration: float = 1.0) -> float:
+    """Измерить скорость проверки (кандидатов/сек) в одном процессе.
+
+    ValueError, если алгоритм не может разобрать sample_hash: bcrypt и Argon2
+    на таком хэше сразу возвращают False, и скорость вышла бы завышенной.
+    """
+    verifier = get_verifier(algo)
+    target = sample_hash or "0" * 32
+    check_hash(algo, target)
+
+    attempts = 0
+    start = time.perf_counter()
+    for password in generate_passwords("abcdefghijklmnopqrstuvwxyz", 8, 8):
+        verifier(password, target)
+        attempts += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= duration:
+            break
+
+    return attempts / elapsed if elapsed > 0 else 0.0
+
+
+def _load_rates(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def get_rate(algo: str, sample_hash: str = None, remeasure: bool = False,
+             cache_path: str = RATES_FILE, duration: float = 1.0):
+    """Скорость для этого хоста: из кэша или измеренная.
+
+    Возвращает (rate, cached).
+    """
+    host = socket.gethostname()
+    key = f"{resolve_algorithm(algo)}{_cost_params(sample_hash)}"
+    rates = _load_rates(cache_path)
+
+    if not remeasure and key in rates.get(host, {}):
+        return rates[host][key], True
+
+    rate = measure_rate(algo, sample_hash, duration)
+    rates.setdefault(host, {})[key] = rate
+
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump(rates, f, indent=2, ensure_ascii=False)
+    return rate, False
+
+
+def plan(charset_size: int, min_len: int, max_len: int, rate: float, workers: int = 1):
+    """Оценить время перебора для каждой длины.
+
+    Для каждой длины возвращает словарь: length, candidates, cumulative,
+    expected_sec (пароль этой длины, в среднем половина её кандидатов)
+    и worst_sec (все кандидаты до этой длины включительно).
+    Скорость считается линейно растущей с числом процессов.
+    """
+    total_rate = rate * max(workers, 1)
+    rows = []
+    cumulative = 0
+
+    for length in range(min_len, max_len + 1):
+        candidates = keyspace_for_length(charset_size, length)
+        expected = cumulative + candidates / 2
+        cumulative += candidates
+        rows.append({
+            "length": length,
+            "candidates": candidates,
+            "cumulative": cumulative,
+            "expected_sec": expected / total_rate if total_rate > 0 else float("inf"),
+            "worst_sec": cumulative / total_rate if total_rate > 0 else float("inf"),
+        })
+    return rows
+
+
+def recommend_max_len(charset_size: int, min_len: int, rate: float,
+                      workers: int, budget: float):
+    """Наибольший max_len, при котором полный перебор укладывается в budget секунд.
+
+    Возвращает None, если не укладывается даже min_len.
+    """
+    total_rate = rate * max(workers, 1)
+    best = None
+    cumulative = 0
+    length = min_len
+
+    while total_rate > 0:
+        cumulative += keyspace_for_length(charset_size, length)
+        if cumulative / total_rate > budget:
+            break
+        best = length
+        length += 1
+        if charset_size <= 1 and length > min_len + 1000:
+            break
+    return best
+
+
+def format_duration(seconds: float) -> str:
+    """Человекочитаемая длительность."""
+    if seconds == float("inf"):
+        return "inf"
+    for unit, size in (("years", 365 * 86400), ("days", 86400), ("h", 3600), ("min", 60)):
+        if seconds >= size:
+            value = seconds / size
+            if value < 1000:
+                return f"{value:.3g} {unit}"
+            return f"{value:,.0f} {unit}" if value < 1e6 else f"{value:.2e} {unit}"
+    return f"{seconds:.3g}s"
@@ -0,0 +1,203 @@
+"""Параллельный прогон матрицы тестов (алгоритм × сложность)."""
+import csv
+import json
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from simple_hashing import get_verifier, get_cost
+from simple_bruteforce import bruteforce
+from simple_events import EventSink, read_events, results_from_events
+
+
+RESULT_FIELDS = [
+    "test", "status", "details", "attempts", "time_sec", "speed_per_sec", "error"
+]
+
+
+def run_case(algo: str, label: str, target_hash: str, charset: str,
+             min_len: int, max_len: int, timeout: float = None):
+    """Прогнать один случай матрицы (выполняется в рабочем процессе)."""
+    name = f"{algo}/{label}"
+    try:
+        verifier = get_verifier(algo)
+        result = bruteforce(
+            target_hash,
+            verifier,
+            charset=charset,
+            min_len=min_len,
+            max_len=max_len,
+            workers=1,
+            timeout=timeout,
+        )
+    except Exception as e:
+        return {"test": name, "status": "FAILED", "error": str(e)}
+
+    elapsed = result["time"]
+    row = {
+        "test": name,
+        "status": "PASSED" if result["found"] else "FAILED",
+        "attempts": result["attempts"],
+        "time_sec": round(elapsed, 3),
+        "speed_per_sec": int(result["attempts"] / elapsed) if elapsed > 0 else 0,
+    }
+    if result["found"]:
+        row["details"] = f"Found password: {result['password']}"
+        row["password"] = result["password"]
+    elif result.get("timeout"):
+        row["details"] = f"Timeout after {elapsed:.2f}s"
+        row["timeout"] = True
+    else:
+        row["details"] = "Keyspace exhausted"
+    return row
+
+
+def _case_cost(case) -> float:
+    """Оценка стоимости случая для планирования очереди."""
+    try:
+        return get_cost(case[0])
+    except ValueError:
+        return 0
+
+
+def _failed_row(case, error: Exception) -> dict:
+    """Строка результата для случая, рабочий процесс которого не вернул ответ."""
+    return {"test": f"{case[0]}/{case[1]}", "status": "FAILED",
+            "error": f"{type(error).__name__}: {error}"}
+
+
+def _run_isolated(case, timeout: float = None) -> dict:
+    """Прогнать случай в собственном процессе: его падение не затронет другие."""
+    try:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            return executor.submit(run_case, *case, timeout).result()
+    except Exception as e:
+        return _failed_row(case, e)
+
+
+def run_matrix(cases: list, workers: int = None, timeout: float = 60,
+               on_result=None):
+    """Прогнать все случаи одновременно на общем пуле процессов.
+
+    cases -- список кортежей (algo, label, target_hash, charset, min_len, max_len).
+    timeout -- бюджет времени на каждый случай в отдельности.
+    on_result -- вызывается для каждого результата в порядке cases.
+
+    Если рабочий процесс погибает (например, убит по памяти), пул ломается
+    и все его незавершённые случаи перезапускаются, каждый в своём процессе:
+    FAILED получает только случай, который уронил процесс.
+
+    Возвращает результаты в том же порядке, что и cases.
+    """
+    workers = workers or os.cpu_count() or 1
+    results = []
+
+    # Дорогие алгоритмы ставим в очередь первыми, чтобы они не оказались в хвосте
+    order = sorted(range(len(cases)), key=lambda i: -_case_cost(cases[i]))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor, \
+            ThreadPoolExecutor(max_workers=workers) as isolated:
+        futures = [None] * len(cases)
+        for i in order:
+            futures[i] = executor.submit(run_case, *cases[i], timeout)
+
+        # Ждём в порядке постановки, чтобы вывод был стабильным
+        for i, case in enumerate(cases):
+            try:
+                row = futures[i].result()
+            except BrokenProcessPool:
+                # Сломанный пул отклоняет всё незавершённое: перезапускаем
+                # эти случаи по одному на процесс, чтобы найти виновный
+                for j in order:
+                    if j >= i and futures[j].exception() is not None:
+                        futures[j] = isolated.submit(_run_isolated, cases[j], timeout)
+                row = futures[i].result()
+            except Exception as e:
+                row = _failed_row(case, e)
+            results.append(row)
+            if on_result:
+                on_result(row)
+
+    return results
+
+
+def summarize(results: list):
+    """Сводные строки по каждому алгоритму."""
+    totals = {}
+    for row in results:
+        algo = row["test"].split("/", 1)[0]
+        total = totals.setdefault(algo, {"cases": 0, "found": 0, "attempts": 0, "time": 0.0})
+        total["cases"] += 1
+        total["found"] += row["status"] == "PASSED"
+        total["attempts"] += row.get("attempts", 0)
+        total["time"] += row.get("time_sec", 0.0)
+
+    summary = []
+    for algo, total in totals.items():
+        summary.append({
+            "test": f"{algo}/total",
+            "status": "PASSED" if total["found"] == total["cases"] else "FAILED",
+            "details": f"{total['found']}/{total['cases']} found",
+            "attempts": total["attempts"],
+            "time_sec": round(total["time"], 3),
+            "speed_per_sec": int(total["attempts"] / total["time"]) if total["time"] > 0 else 0,
+        })
+    return summary
+
+
+def save_results_csv(results: list, path: str):
+    """Сохранить результаты в CSV."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        for result in results:
+            writer.writerow({field: result.get(field, "") for field in RESULT_FIELDS})
+
+
+def save_results_json(results: list, path: str):
+    """Сохранить результаты в JSON."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+def run_and_save(cases: list, workers: int = None, timeout: float = 60,
+                 output_dir: str = "out", on_result=None, sink: EventSink = None):
+    """Прогнать матрицу и записать сводку в out/results.json и out/results.csv.
+
+    Каждый результат пишется в журнал событий, сводки строятся из него.
+    """
+    own_sink = sink is None
+    if own_sink:
+        sink = EventSink(os.path.join(output_dir, "events.jsonl"))
+
+    # Свой id у каждого прогона: сводка берёт только его результаты
+    job_id = uuid.uuid4().hex
+
+    def record(row):
+        sink.emit("result", job=job_id, **row)
+        if on_result:
+            on_result(row)
+
+    sink.emit("job_start", job=job_id, mode="matrix", cases=len(cases),
+              workers=workers, timeout=timeout)
+    start = time.perf_counter()
+    run_matrix(cases, workers=workers, timeout=timeout, on_result=record)
+    wall_time = time.perf_counter() - start
+
+    sink.flush()
+    results = results_from_events(
+        read_events(sink.path, run_id=sink.run_id, event="result", job=job_id)
+    )
+    rows = results + summarize(results)
+    sink.emit("job_done", job=job_id, mode="matrix", cases=len(cases),
+              wall_time=round(wall_time, 3))
+    if own_sink:
+        sink.close()
+
+    save_results_csv(rows, os.path.join(output_dir, "results.csv"))
+    save_results_json(rows, os.path.join(output_dir, "results.json"))
+    return rows, wall_time
@@ -0,0 +1,136 @@
+"""Компактный индекс целевых хэшей для больших списков (миллионы дайджестов).
+
+Дайджесты хранятся в файле как отсортированный массив сырых байтов
+фиксированной ширины. Перед ним лежит таблица из 65536 корзин по первым
+двум байтам дайджеста, поэтому поиск -- это несколько сравнений внутри
+одной корзины. Файл открывается через mmap, а при передаче в рабочий
+процесс сериализуется только путь: все процессы отображают одни и те же
+страницы вместо копирования набора строк.
+"""
+import mmap
+import os
+import struct
+from array import array
+
+
+MAGIC = b"SLTI"
+HEADER = struct.Struct("<4sIQ")  # magic, width, count
+BUCKETS = 1 << 16
+
+
+def _to_digest(value) -> bytes:
+    """Привести hex-строку или bytes к сырому дайджесту."""
+    if isinstance(value, str):
+        return bytes.fromhex(value.strip())
+    return bytes(value)
+
+
+def build_index(digests, path: str) -> int:
+    """Построить файл индекса из hex-строк или сырых дайджестов.
+
+    Возвращает число уникальных дайджестов.
+    """
+    buckets = [bytearray() for _ in range(BUCKETS)]
+    width = None
+
+    for value in digests:
+        digest = _to_digest(value)
+        if width is None:
+            width = len(digest)
+            if width < 2:
+                raise ValueError("Слишком короткий дайджест")
+        elif len(digest) != width:
+            raise ValueError(f"Дайджесты разной длины: {len(digest)} != {width}")
+        buckets[(digest[0] << 8) | digest[1]] += digest
+
+    width = width or 2
+    table = array("Q", [0]) * (BUCKETS + 1)
+    count = 0
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, width, 0))
+        f.write(table.tobytes())
+
+        for i, bucket in enumerate(buckets):
+            if bucket:
+                items = sorted({bytes(bucket[j:j + width]) for j in range(0, len(bucket), width)})
+                f.write(b"".join(items))
+                count += len(items)
+                buckets[i] = None
+            table[i + 1] = count
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, width, count))
+        f.write(table.tobytes())
+
+    os.replace(tmp_path, path)
+    return count
+
+
+class TargetIndex:
+    """Индекс дайджестов в mmap-файле с поддержкой `digest in index`."""
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.width, self.count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Не файл индекса: {path}")
+
+        table_size = (BUCKETS + 1) * array("Q").itemsize
+        self._table = memoryview(self._mm)[HEADER.size:HEADER.size + table_size].cast("Q")
+        self._data = HEADER.size + table_size
+
+    @classmethod
+    def from_hex_file(cls, hex_path: str, index_path: str = None):
+        """Открыть индекс для текстового файла с hex-хэшами (по одному в строке).
+
+        Индекс строится рядом с файлом (<файл>.idx) и переиспользуется,
+        пока исходный файл не изменится.
+        """
+        index_path = index_path or hex_path + ".idx"
+        if (not os.path.exists(index_path)
+                or os.path.getmtime(index_path) < os.path.getmtime(hex_path)):
+            with open(hex_path, encoding="utf-8") as f:
+                build_index((line for line in f if line.strip()), index_path)
+        return cls(index_path)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, value) -> bool:
+        digest = _to_digest(value) if isinstance(value, str) else value
+        if len(digest) != self.width:
+            return False
+
+        bucket = (digest[0] << 8) | digest[1]
+        lo, hi = self._table[bucket], self._table[bucket + 1]
+        if lo == hi:
+            return False
+
+        # Корзина маленькая: один поиск на уровне C быстрее бинарного поиска в Python
+        width, base = self.width, self._data
+        start, end = base + lo * width, base + hi * width
+        pos = self._mm.find(digest, start, end)
+        while pos != -1:
+            if (pos - base) % width == 0:
+                return True
+            pos = self._mm.find(digest, pos + 1, end)
+        return False
+
+    def __iter__(self):
+        for i in range(self.count):
+            start = self._data + i * self.width
+            yield self._mm[start:start + self.width]
+
+    def __reduce__(self):
+        # В рабочий процесс передаётся только путь, страницы общие через mmap
+        return (TargetIndex, (self.path,))
+
+    def close(self):
+        """Закрыть отображение файла."""
+        self._table.release()
+        self._mm.close()
@@ -3,12 +3,25 @@ import time
 import sys
 import os
 import json
-import csv
+import asyncio
+import subprocess
+import multiprocessing
+import pickle
+import hashlib
+import tempfile
 from simple_hashing import (
     verify_sha1, verify_md5, verify_bcrypt, verify_argon2,
-    get_verifier
+    get_verifier, get_batch_verifier, get_cost, register_algorithm,
+    unregister_algorithm, resolve_algorithm, digest_password, list_algorithms
 )
-from simple_bruteforce import bruteforce
+from simple_bruteforce import bruteforce, bruteforce_targets
+from simple_targets import TargetIndex, build_index
+from simple_async import crack
+from simple_runner import (
+    run_matrix, run_and_save, summarize, save_results_csv, save_results_json
+)
+from simple_events import EventSink, read_events, results_from_events
+from simple_planner import keyspace, get_rate, plan, recommend_max_len
 
 # Вывод в папку out
 output_dir = "out"
@@ -18,22 +31,33 @@ if not os.path.exists(output_dir):
 output_file_txt = os.path.join(output_dir, "out.txt")
 output_file_csv = os.path.join(output_dir, "results.csv")
 output_file_json = os.path.join(output_dir, "results.json")
+output_file_events = os.path.join(output_dir, "events.jsonl")
+
+# Журнал событий текущего запуска: создаётся в run_all_tests(), а не при
+# импорте (pytest и дочерние процессы spawn тоже импортируют этот модуль)
+events = None
 
-# Глобальный список результатов тестов
-test_results = []
+# Текстовый лог держим открытым, вместо открытия файла на каждую строку
+_log_file = None
 
 
 def log_print(*args, **kwargs):
     """Вывод в консоль и в файл."""
-    with open(output_file_txt, "a", encoding="utf-8") as f:
-        print(*args, **kwargs)
-        print(*args, **kwargs, file=f)
+    global _log_file
+    if _log_file is None:
+        _log_file = open(output_file_txt, "a", encoding="utf-8")
+    print(*args, **kwargs)
+    print(*args, **kwargs, file=_log_file)
+
+
+def record_result(result: dict):
+    """Записать результат теста в журнал событий запуска (если он идёт)."""
+    if events is not None:
+        events.emit("result", **result)
 
 
 def test_hashing_functions():
     """Тестировать функции хэширования."""
-    global test_results
-    
     log_print("\n" + "="*70)
     log_print("TEST 1: Hash Functions")
     log_print("="*70)
@@ -54,7 +78,7 @@ def test_hashing_functions():
     assert verify_argon2("123456", "$argon2id$v=19$m=65536,t=3,p=2$c2FsdHNhbHQ$PUF5UxxoUY++mMekkQwFurL0ZsTtB7lelO23zcyZQ0c")
     log_print("OK: Argon2 verification works")
     
-    test_results.append({
+    record_result({
         "test": "test_hashing_functions",
         "status": "PASSED",
         "details": "All hash functions verified successfully"
@@ -63,8 +87,6 @@ def test_hashing_functions():
 
 def test_get_verifier():
     """Тестировать функцию get_verifier."""
-    global test_results
-    
     log_print("\n" + "="*70)
     log_print("TEST 2: Function get_verifier")
     log_print("="*70)
@@ -74,6 +96,10 @@ def test_get_verifier():
         ("md5", "e10adc3949ba59abbe56e057f20f883e"),
         ("bcrypt", "$2a$10$z4u9ZkvopUiiytaNX7wfGedy9Lu2ywUxwYpbsAR5YBrAuUs3YGXdi"),
         ("argon2", "$argon2id$v=19$m=65536,t=3,p=2$c2FsdHNhbHQ$PUF5UxxoUY++mMekkQwFurL0ZsTtB7lelO23zcyZQ0c"),
+        ("sha256", "8d969eef6ecad3c29a3a629280e686cf0c3f5d5a86aff3ca12020c923adc6c92"),
+        ("sha512", "ba3253876aed6bc22d4a6ff53d8406c6ad864195ed144ab5c87621b6c233b548"
+                   "baeae6956df346ec8c17f5ea10f35ee3cbc514797ed7ddd3145464e2a0bab413"),
+        ("ntlm", "32ED87BDB5FDC5E9CBA88547376818D4"),
     ]
 
     for algo, target_hash in verifiers:
@@ -88,17 +114,49 @@ def test_get_verifier():
     except ValueError:
         log_print("OK: get_verifier raises error for unknown algorithm")
     
-    test_results.append({
+    record_result({
         "test": "test_get_verifier",
         "status": "PASSED",
         "details": "All verifiers working correctly"
     })
 
 
+def test_algorithm_registry():
+    """Тестировать реестр алгоритмов и ленивую загрузку библиотек."""
+    log_print("\n" + "="*70)
+    log_print("TEST 2a: Algorithm registry")
+    log_print("="*70)
+
+    # Пакетная проверка работает с сырыми дайджестами
+    targets = {bytes.fromhex("e10adc3949ba59abbe56e057f20f883e")}
+    hits = get_batch_verifier("md5")(["1", "123456", "654321"], targets)
+    assert hits == [("123456", "e10adc3949ba59abbe56e057f20f883e")], f"Wrong hits: {hits}"
+    assert get_batch_verifier("bcrypt") is None
+    assert get_cost("argon2id") > get_cost("bcrypt") > get_cost("md5")
+    assert resolve_algorithm("SHA-256") == "sha256"
+    assert len(digest_password(resolve_algorithm("sha-1"), "")) == 20
+    log_print("OK: batch verifiers and cost hints work")
+
+    # bcrypt и argon2 не должны загружаться вместе с модулем
+    code = (
+        "import sys, simple_hashing; "
+        "simple_hashing.get_verifier('md5')('a', 'b'); "
+        "print('bcrypt' in sys.modules, 'argon2' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                         cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert out.stdout.split() == ["False", "False"], f"Eager imports: {out.stdout}"
+    log_print("OK: bcrypt/argon2 are imported lazily")
+
+    record_result({
+        "test": "test_algorithm_registry",
+        "status": "PASSED",
+        "details": "Registry, batch verifiers and lazy imports work"
+    })
+
+
 def test_bruteforce_sha1():
     """Тестировать bruteforce для SHA-1."""
-    global test_results
-    
     log_print("\n" + "="*70)
     log_print("TEST 3: Bruteforce SHA-1")
     log_print("="*70)
@@ -118,7 +176,7 @@ def test_bruteforce_sha1():
     log_print(f"   Time: {result['time']:.3f}s")
     log_print(f"   Speed: {result['attempts']/result['time']:,.0f} attempts/sec")
     
-    test_results.append({
+    record_result({
         "test": "test_bruteforce_sha1",
         "status": "PASSED",
         "details": f"Found password: {result['password']}",
@@ -130,8 +188,6 @@ def test_bruteforce_sha1():
 
 def test_bruteforce_md5():
     """Тестировать bruteforce для MD5."""
-    global test_results
-    
     log_print("\n" + "="*70)
     log_print("TEST 4: Bruteforce MD5")
     log_print("="*70)
@@ -151,7 +207,7 @@ def test_bruteforce_md5():
     log_print(f"   Time: {result['time']:.3f}s")
     log_print(f"   Speed: {result['attempts']/result['time']:,.0f} attempts/sec")
     
-    test_results.append({
+    record_result({
         "test": "test_bruteforce_md5",
         "status": "PASSED",
         "details": f"Found password: {result['password']}",
@@ -163,8 +219,6 @@ def test_bruteforce_md5():
 
 def test_bruteforce_timeout():
     """Тестировать timeout функциональность."""
-    global test_results
-    
     log_print("\n" + "="*70)
     log_print("TEST 5: Timeout functionality")
     log_print("="*70)
@@ -184,7 +238,7 @@ def test_bruteforce_timeout():
     log_print(f"   Actual time: {elapsed:.3f}s")
     log_print(f"   Attempts before timeout: {result['attempts']:,}")
     
-    test_results.append({
+    record_result({
         "test": "test_bruteforce_timeout",
         "status": "PASSED",
         "details": "Timeout triggered correctly",
@@ -195,8 +249,6 @@ def test_bruteforce_timeout():
 
 def test_performance_comparison():
     """Сравнить производительность SHA-1 и MD5."""
-    global test_results
-    
     log_print("\n" + "="*70)
     log_print("TEST 6: Performance comparison SHA-1 vs MD5")
     log_print("="*70)
@@ -227,7 +279,7 @@ def test_performance_comparison():
     log_print(f"MD5 speed:   {md5_speed:,.0f} attempts/sec")
     log_print(f"Ratio: SHA-1 is {sha1_speed/md5_speed:.2f}x {'faster' if sha1_speed > md5_speed else 'slower'}")
     
-    test_results.append({
+    record_result({
         "test": "test_performance_comparison",
         "status": "PASSED",
         "details": f"SHA-1 {sha1_speed:,.0f} vs MD5 {md5_speed:,.0f}",
@@ -237,15 +289,313 @@ def test_performance_comparison():
     })
 
 
+def _crash_verifier(password: str, target_hash: str) -> bool:
+    """Имитация рабочего процесса, убитого системой (например, по памяти)."""
+    os._exit(1)
+
+
+def test_run_matrix():
+    """Тестировать параллельный прогон матрицы."""
+    log_print("\n" + "="*70)
+    log_print("TEST 7: Concurrent test matrix")
+    log_print("="*70)
+
+    cases = [
+        ("sha1", "easy", "7110eda4d09e062aa5e4a390b0a572ac0d2c0220", "0123456789", 1, 4),  # 1234
+        ("md5", "easy", "81dc9bdb52d04dc20036dbd8313ed055", "0123456789", 1, 4),  # 1234
+        ("md5", "timeout", "77892341aa9dc66e97f5c248782b5d92", "abcdefghijklmnopqrstuvwxyz", 1, 8),
+    ]
+
+    start = time.perf_counter()
+    results = run_matrix(cases, workers=2, timeout=1)
+    elapsed = time.perf_counter() - start
+
+    assert [r["test"] for r in results] == ["sha1/easy", "md5/easy", "md5/timeout"], "Wrong order"
+    assert results[0]["password"] == "1234"
+    assert results[1]["password"] == "1234"
+    assert results[2]["status"] == "FAILED" and results[2].get("timeout")
+
+    summary = {row["test"]: row for row in summarize(results)}
+    assert summary["sha1/total"]["details"] == "1/1 found"
+    assert summary["md5/total"]["details"] == "1/2 found"
+    log_print(f"OK: {len(cases)} cases finished in {elapsed:.3f}s, order preserved")
+
+    # Упавший рабочий процесс не должен обрывать остальные случаи матрицы
+    if multiprocessing.get_start_method() == "fork":
+        register_algorithm("crash_test", _crash_verifier)
+        try:
+            for workers in (1, 2):
+                broken = run_matrix([("crash_test", "oom", "x", "0123456789", 1, 1)] + cases[:2],
+                                    workers=workers, timeout=1)
+                assert [r["test"] for r in broken] == ["crash_test/oom", "sha1/easy", "md5/easy"]
+                assert broken[0]["status"] == "FAILED" and "BrokenProcessPool" in broken[0]["error"]
+                assert broken[1]["status"] == "PASSED" and broken[1]["password"] == "1234"
+                assert broken[2]["status"] == "PASSED" and broken[2]["password"] == "1234"
+        finally:
+            unregister_algorithm("crash_test")
+        assert "crash_test" not in list_algorithms()
+        log_print("OK: only the crashed case is FAILED, the rest of the matrix finishes")
+
+    record_result({
+        "test": "test_run_matrix",
+        "status": "PASSED",
+        "details": f"{len(cases)} cases in stable order",
+        "time_sec": round(elapsed, 3)
+    })
+
+
+def test_planner():
+    """Тестировать оценку пространства перебора и времени."""
+    log_print("\n" + "="*70)
+    log_print("TEST 8: Keyspace and time planner")
+    log_print("="*70)
+
+    # alnum, длины 1-10: точное число кандидатов
+    assert keyspace(62, 1, 10) == sum(62 ** n for n in range(1, 11))
+    assert keyspace(10, 6, 6) == 1_000_000
+
+    rows = plan(10, 1, 3, rate=100, workers=2)
+    assert [r["cumulative"] for r in rows] == [10, 110, 1110]
+    assert rows[1]["worst_sec"] == 110 / 200
+    assert rows[1]["expected_sec"] == (10 + 50) / 200
+
+    # 1110 кандидатов за 6 секунд при 200/сек укладываются, 11110 -- нет
+    assert recommend_max_len(10, 1, rate=100, workers=2, budget=6) == 3
+    assert recommend_max_len(10, 4, rate=100, workers=2, budget=6) is None
+    log_print("OK: keyspace, plan and recommendation are exact")
+
+    cache_path = os.path.join(output_dir, "rates_test.json")
+    try:
+        rate, cached = get_rate("md5", remeasure=True, cache_path=cache_path, duration=0.1)
+        assert rate > 0 and not cached
+        cached_rate, cached = get_rate("md5", cache_path=cache_path)
+        assert cached and cached_rate == rate
+
+        # Псевдонимы делят одну запись кэша
+        get_rate("sha-1", cache_path=cache_path, duration=0.1)
+        assert get_rate("sha1", cache_path=cache_path)[1]
+
+        # Неразбираемый хэш не измеряется и не попадает в кэш
+        for algo, bad_hash in (("bcrypt", "$2a$10$typo"), ("argon2", "$argon2id$typo")):
+            try:
+                get_rate(algo, bad_hash, cache_path=cache_path, duration=0.1)
+                assert False, f"{algo}: bad sample hash was measured"
+            except ValueError:
+                pass
+        with open(cache_path, encoding="utf-8") as f:
+            keys = [key for host in json.load(f).values() for key in host]
+        assert sorted(keys) == ["md5", "sha1"], f"Unexpected cache keys: {keys}"
+    finally:
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+    log_print(f"OK: measured MD5 rate {rate:,.0f}/sec, cached for this host")
+
+    record_result({
+        "test": "test_planner",
+        "status": "PASSED",
+        "details": "Keyspace, plan and rate cache work",
+        "speed_per_sec": int(rate)
+    })
+
+
+def test_target_index():
+    """Тестировать компактный индекс целей и перебор по списку хэшей."""
+    log_print("\n" + "="*70)
+    log_print("TEST 9: Target index for large hash lists")
+    log_print("="*70)
+
+    known = ["1234", "4242", "777"]
+    hexes = [hashlib.md5(f"noise{i}".encode()).hexdigest() for i in range(20000)]
+    hexes += [hashlib.md5(p.encode()).hexdigest() for p in known]
+    hexes.append(hexes[0])  # дубликат
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "targets.idx")
+        count = build_index(hexes, path)
+        assert count == len(hexes) - 1, f"Wrong count: {count}"
+
+        targets = TargetIndex(path)
+        assert all(h in targets for h in hexes)
+        assert hashlib.md5(b"absent").digest() not in targets
+        assert len(pickle.dumps(targets)) < 1000, "Index must be pickled by path"
+        log_print(f"OK: {count:,} digests indexed, {os.path.getsize(path):,} bytes on disk")
+
+        start = time.perf_counter()
+        result = bruteforce_targets(
+            targets, get_batch_verifier("md5"), "0123456789", min_len=1, max_len=4, workers=2
+        )
+        elapsed = time.perf_counter() - start
+        targets.close()
+
+    found = sorted(hit["password"] for hit in result["hits"])
+    assert found == sorted(known), f"Wrong hits: {found}"
+    assert result["attempts"] == 11110, f"Wrong attempts: {result['attempts']}"
+    log_print(f"OK: cracked {len(found)} targets in {elapsed:.3f}s")
+
+    record_result({
+        "test": "test_target_index",
+        "status": "PASSED",
+        "details": f"Cracked {len(found)} of {count} targets",
+        "attempts": result["attempts"],
+        "time_sec": round(elapsed, 3)
+    })
+
+
+def test_async_crack():
+    """Тестировать асинхронный API: события, общий пул и отмену."""
+    log_print("\n" + "="*70)
+    log_print("TEST 10: Async crack API")
+    log_print("="*70)
+
+    verifier = get_verifier("sha1")
+    charset = "0123456789"
+
+    async def collect(target_hash):
+        return [event async for event in crack(
+            target_hash, verifier, charset, min_len=1, max_len=4,
+            backend="thread", progress_interval=0,
+        )]
+
+    async def cancel_long_crack():
+        ticks = 0
+
+        async def consume():
+            async for _ in crack("0" * 40, verifier, charset, min_len=1, max_len=12,
+                                 workers=2, backend="process"):
+                pass
+
+        task = asyncio.create_task(consume())
+        start = time.perf_counter()
+        while time.perf_counter() - start < 0.5:
+            await asyncio.sleep(0.01)
+            ticks += 1
+        task.cancel()
+        cancel_start = time.perf_counter()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return ticks, time.perf_counter() - cancel_start
+
+    async def run():
+        first, second = await asyncio.gather(
+            collect("7110eda4d09e062aa5e4a390b0a572ac0d2c0220"),  # 1234
+            collect("7b52009b64fd0a2a49e6d8a939753077792b0554"),  # 12
+        )
+        return first, second, await cancel_long_crack()
+
+    first, second, (ticks, cancel_time) = asyncio.run(run())
+
+    for events, password in ((first, "1234"), (second, "12")):
+        kinds = [event["event"] for event in events]
+        assert kinds[0] == "start" and kinds[-1] == "done", f"Wrong events: {kinds}"
+        hits = [event["password"] for event in events if event["event"] == "hit"]
+        assert hits == [password], f"Wrong hits: {hits}"
+    log_print("OK: two concurrent cracks shared one pool and streamed events")
+
+    # Список целей: индекс дайджестов и пакетная проверка вместо verifier
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "targets.idx")
+        build_index([hashlib.md5(p.encode()).hexdigest() for p in ("12", "4242", "absent!")], path)
+        targets = TargetIndex(path)
+
+        async def collect_index():
+            return [event async for event in crack(
+                targets, None, charset, min_len=1, max_len=4, workers=2,
+                backend="process", batch=get_batch_verifier("md5"),
+            )]
+
+        index_events = asyncio.run(collect_index())
+        targets.close()
+
+    hits = sorted(event["password"] for event in index_events if event["event"] == "hit")
+    assert hits == ["12", "4242"], f"Wrong hits: {hits}"
+    assert index_events[-1]["cracked"] == 2 and index_events[-1]["attempts"] == 11110
+    log_print("OK: crack() works with TargetIndex and a batch verifier")
+
+    # Несериализуемая функция проверки: понятная ошибка до запуска пула
+    try:
+        bruteforce("x", lambda password, target_hash: False, charset, max_len=2, workers=2)
+        assert False, "Should raise error"
+    except ValueError as e:
+        assert "thread" in str(e)
+    log_print("OK: unpicklable verifier with workers > 1 raises ValueError")
+
+    assert ticks > 10, f"Event loop was blocked: {ticks} ticks"
+    assert cancel_time < 1.0, f"Cancel took {cancel_time:.3f}s"
+    log_print(f"OK: event loop stayed responsive ({ticks} ticks), cancel took {cancel_time:.3f}s")
+
+    record_result({
+        "test": "test_async_crack",
+        "status": "PASSED",
+        "details": "Streaming events, shared pool and cancellation work",
+        "time_sec": round(cancel_time, 3)
+    })
+
+
+def test_event_sink():
+    """Тестировать буферизованный журнал событий с ротацией."""
+    log_print("\n" + "="*70)
+    log_print("TEST 11: Buffered event sink")
+    log_print("="*70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "events.jsonl")
+
+        # Сброс по таймеру без явного flush()
+        sink = EventSink(path, flush_interval=0.05, run_id="timer")
+        sink.emit("progress", attempts=1)
+        time.sleep(0.3)
+        assert [e["attempts"] for e in read_events(path, run_id="timer")] == [1]
+        sink.close()
+
+        # Ротация по размеру: события читаются из всех файлов по порядку
+        with EventSink(path, max_bytes=2000, backups=10, buffer_bytes=500, run_id="rotate") as sink:
+            for i in range(200):
+                sink.emit("result", test=f"t{i}", status="PASSED")
+        assert os.path.exists(path + ".1"), "Log must be rotated"
+
+        rows = results_from_events(read_events(path, run_id="rotate"))
+        assert [row["test"] for row in rows][-3:] == ["t197", "t198", "t199"]
+        assert rows[-1] == {"test": "t199", "status": "PASSED"}
+        rotated = len([name for name in os.listdir(tmp) if name.startswith("events.jsonl.")])
+        log_print(f"OK: timer flush works, {rotated} rotated files, events read in order")
+
+        # Два прогона подряд (в ту же секунду, в том же процессе) не смешивают результаты
+        cases = [("md5", "a", "81dc9bdb52d04dc20036dbd8313ed055", "0123456789", 1, 4)]
+        for _ in range(2):
+            rows, _ = run_and_save(cases, workers=1, timeout=5, output_dir=tmp)
+            assert [row["test"] for row in rows] == ["md5/a", "md5/total"], f"Rows: {rows}"
+        with EventSink(os.path.join(tmp, "events.jsonl")) as sink:
+            for _ in range(2):
+                rows, _ = run_and_save(cases, workers=1, timeout=5, output_dir=tmp, sink=sink)
+                assert [row["test"] for row in rows] == ["md5/a", "md5/total"], f"Rows: {rows}"
+        with open(os.path.join(tmp, "results.json"), encoding="utf-8") as f:
+            assert len(json.load(f)) == 2
+        log_print("OK: repeated runs produce one row per case")
+
+    record_result({
+        "test": "test_event_sink",
+        "status": "PASSED",
+        "details": "Buffered writes, timer flush and rotation work"
+    })
+
+
 def run_all_tests():
     """Запустить все тесты."""
-    global test_results
-    test_results = []
-    
-    # Очистить файлы вывода
-    with open(output_file_txt, "w", encoding="utf-8") as f:
-        f.write("")
     
+    global _log_file, events
+
+    # Новый журнал событий на каждый запуск: сводка берёт только его результаты
+    if events is not None:
+        events.close()
+    events = EventSink(output_file_events)
+
+    # Очистить текстовый лог
+    if _log_file is not None:
+        _log_file.close()
+    _log_file = open(output_file_txt, "w", encoding="utf-8")
+
     log_print("""
 ========================================================================
                          RUNNING ALL TESTS
@@ -255,29 +605,43 @@ def run_all_tests():
     tests = [
         test_hashing_functions,
         test_get_verifier,
+        test_algorithm_registry,
         test_bruteforce_sha1,
         test_bruteforce_md5,
         test_bruteforce_timeout,
         test_performance_comparison,
+        test_run_matrix,
+        test_planner,
+        test_target_index,
+        test_async_crack,
+        test_event_sink,
     ]
 
     passed = 0
     failed = 0
+    events.emit("job_start", mode="tests", tests=len(tests))
+    run_start = time.perf_counter()
 
     for test in tests:
+        events.emit("test_start", test=test.__name__)
+        start = time.perf_counter()
         try:
             test()
             passed += 1
         except Exception as e:
             failed += 1
             log_print(f"FAIL: Test failed: {e}")
-            test_results.append({
+            record_result({
                 "test": test.__name__,
                 "status": "FAILED",
                 "error": str(e)
             })
             import traceback
             traceback.print_exc()
+        events.emit("timing", test=test.__name__, time_sec=round(time.perf_counter() - start, 3))
+
+    events.emit("job_done", mode="tests", passed=passed, failed=failed,
+                time_sec=round(time.perf_counter() - run_start, 3))
 
     log_print("\n" + "="*70)
     log_print(f"TEST RESULTS: {passed} passed, {failed} failed")
@@ -288,14 +652,22 @@ def run_all_tests():
     else:
         log_print(f"FAILED: {failed} TESTS FAILED")
 
-    # Сохранить результаты в CSV и JSON
-    _save_results_csv()
-    _save_results_json()
-    
+    # Сохранить результаты в CSV и JSON (из журнала событий этого запуска)
+    events.flush()
+    test_results = results_from_events(
+        read_events(output_file_events, run_id=events.run_id, event="result")
+    )
+    save_results_csv(test_results, output_file_csv)
+    save_results_json(test_results, output_file_json)
+    events.close()
+    events = None
+
     log_print(f"\nResults saved to:")
     log_print(f"  - {output_file_txt}")
     log_print(f"  - {output_file_csv}")
     log_print(f"  - {output_file_json}")
+    log_print(f"  - {output_file_events}")
+    _log_file.flush()
 
     if failed == 0:
         return 0
@@ -303,30 +675,5 @@ def run_all_tests():
         return 1
 
 
-def _save_results_csv():
-    """Сохранить результаты в CSV."""
-    with open(output_file_csv, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=[
-            "test", "status", "details", "attempts", "time_sec", "speed_per_sec", "error"
-        ])
-        writer.writeheader()
-        for result in test_results:
-            writer.writerow({
-                "test": result.get("test", ""),
-                "status": result.get("status", ""),
-                "details": result.get("details", ""),
-                "attempts": result.get("attempts", ""),
-                "time_sec": result.get("time_sec", ""),
-                "speed_per_sec": result.get("speed_per_sec", ""),
-                "error": result.get("error", "")
-            })
-
-
-def _save_results_json():
-    """Сохранить результаты в JSON."""
-    with open(output_file_json, "w", encoding="utf-8") as f:
-        json.dump(test_results, f, indent=2, ensure_ascii=False)
-
-
 if __name__ == "__main__":
     exit(run_all_tests())